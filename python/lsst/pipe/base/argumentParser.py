@@ -24,8 +24,10 @@ __all__ = ["ArgumentParser", "ConfigFileAction", "ConfigValueAction", "DataIdCon
 
 import abc
 import argparse
+import ast
 import collections
 import fnmatch
+import functools
 import itertools
 import logging
 import os
@@ -39,12 +41,53 @@ import lsst.utils
 import lsst.pex.config as pexConfig
 import lsst.pex.config.history
 import lsst.log as lsstLog
-import lsst.daf.persistence as dafPersist
 
 DEFAULT_INPUT_NAME = "PIPE_INPUT_ROOT"
 DEFAULT_CALIB_NAME = "PIPE_CALIB_ROOT"
 DEFAULT_OUTPUT_NAME = "PIPE_OUTPUT_ROOT"
 
+# Integer range in a data ID value, e.g. "1..5" or "1..5:2".
+_RANGE_RE = re.compile(r"(\d+)\.\.(\d+)(?::(\d+))?\Z")
+
+# A ``name=value`` pair with non-empty name and value.
+_NAME_VALUE_RE = re.compile(r"([^=]+)=(.+)\Z", re.DOTALL)
+
+# Values of -c overrides that can be converted without parsing.
+_CONSTANT_VALUES = {"True": True, "False": False, "None": None}
+
+# Integer and floating-point literals, which -c values can be converted
+# to without calling eval.
+_INT_RE = re.compile(r"[-+]?(?:0+|[1-9]\d*)\Z", re.ASCII)
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][-+]?\d+)?\Z", re.ASCII)
+
+# Notes shown at the end of the ArgumentParser help message.
+_EPILOG = textwrap.dedent("""Notes:
+            * --config, --configfile, --id, --loglevel and @file may appear multiple times;
+                all values are used, in order left to right
+            * @file reads command-line options from the specified file:
+                * data may be distributed among multiple lines (e.g. one option per line)
+                * data after # is treated as a comment and ignored
+                * blank lines and lines starting with # are ignored
+            * To specify multiple values for an option, do not use = after the option name:
+                * right: --configfile foo bar
+                * wrong: --configfile=foo bar
+            """)
+
+# Log levels accepted by --loglevel, keyed by upper-case level name.
+_LOG_LEVELS = {name: getattr(lsstLog.Log, name)
+               for name in ("TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FATAL")}
+
+# A token of an @file line, delimited by the whitespace characters that
+# shlex splits on (str.split would also split on other whitespace).
+_ARG_TOKEN_RE = re.compile(r"[^ \t\r\n]+")
+
+# Mapper classes of input repositories, keyed by absolute repository path.
+_MAPPER_CLASS_CACHE = {}
+
+# Candidate obs package config override files and whether each exists,
+# keyed by (obs package directory, camera name, task name).
+_OVERRIDE_FILE_CACHE = {}
+
 
 def _fixPath(defName, path):
     """Apply environment variable as default root, if present, and abspath.
@@ -72,6 +115,29 @@ def _fixPath(defName, path):
     return os.path.abspath(os.path.join(defRoot, path or ""))
 
 
+def _getMapperClass(path):
+    """Return the mapper class of a data repository, caching the result.
+
+    Parameters
+    ----------
+    path : `str`
+        Absolute path of the data repository.
+
+    Returns
+    -------
+    mapperClass : `type` or `None`
+        Mapper class of the repository, or `None` if no mapper is specified.
+        `None` is not cached, so a repository created later is still found.
+    """
+    mapperClass = _MAPPER_CLASS_CACHE.get(path)
+    if mapperClass is None:
+        import lsst.daf.persistence as dafPersist
+        mapperClass = dafPersist.Butler.getMapperClass(path)
+        if mapperClass is not None:
+            _MAPPER_CLASS_CACHE[path] = mapperClass
+    return mapperClass
+
+
 class DataIdContainer:
     """Container for data IDs and associated data references.
 
@@ -143,6 +209,15 @@ class DataIdContainer:
         ----------
         butler : `lsst.daf.persistence.Butler`
             Data butler.
+
+        Raises
+        ------
+        KeyError
+            Raised if the butler cannot provide the data ID keys for the
+            dataset type.
+        TypeError
+            Raised if any data ID value cannot be cast to the required type;
+            the message lists every such value.
         """
         if self.datasetType is None:
             raise RuntimeError("Must call setDatasetType first")
@@ -152,26 +227,41 @@ class DataIdContainer:
             msg = f"Cannot get keys for datasetType {self.datasetType} at level {self.level}"
             raise KeyError(msg) from e
 
+        log = None
+        # Most keys are strings and need no cast. For the rest, hold the type
+        # and a cache of cast values by string value: the same values recur
+        # across the data IDs of a cross product, so each is cast only once.
+        casterDict = {key: (keyType, {}) for key, keyType in idKeyTypeDict.items() if keyType != str}
+        # Report every value that cannot be cast, not just the first; a dict
+        # is used as an ordered set so each message is only reported once.
+        castErrors = {}
         for dataDict in self.idList:
             for key, strVal in dataDict.items():
+                caster = casterDict.get(key)
+                if caster is None:
+                    if key not in idKeyTypeDict:
+                        # OK, assume that it's a valid key and guess that
+                        # it's a string
+                        if log is None:
+                            log = lsstLog.Log.getDefaultLogger()
+                        log.warn("Unexpected ID %s; guessing type is \"str\"", key)
+                        idKeyTypeDict[key] = str
+                    continue
+
+                keyType, castCache = caster
                 try:
-                    keyType = idKeyTypeDict[key]
-                except KeyError:
-                    # OK, assume that it's a valid key and guess that it's a
-                    # string
-                    keyType = str
-
-                    log = lsstLog.Log.getDefaultLogger()
-                    log.warn("Unexpected ID %s; guessing type is \"%s\"",
-                             key, 'str' if keyType == str else keyType)
-                    idKeyTypeDict[key] = keyType
-
-                if keyType != str:
+                    castVal = castCache[strVal]
+                except (KeyError, TypeError):
                     try:
                         castVal = keyType(strVal)
                     except Exception:
-                        raise TypeError(f"Cannot cast value {strVal!r} to {keyType} for ID key {key}")
-                    dataDict[key] = castVal
+                        castErrors[f"Cannot cast value {strVal!r} to {keyType} for ID key {key}"] = None
+                        continue
+                    if isinstance(strVal, str):
+                        castCache[strVal] = castVal
+                dataDict[key] = castVal
+        if castErrors:
+            raise TypeError("; ".join(castErrors))
 
     def makeDataRefList(self, namespace):
         """Compute refList based on idList.
@@ -189,10 +279,26 @@ class DataIdContainer:
         """
         if self.datasetType is None:
             raise RuntimeError("Must call setDatasetType first")
+        import lsst.daf.persistence as dafPersist
+
         butler = namespace.butler
+        datasetType = self.datasetType
+        level = self.level
+        searchDataRefs = dafPersist.searchDataRefs
+        # The same data ID may be specified more than once (e.g. by
+        # overlapping --id arguments); only search the butler once for each.
+        refListCache = {}
         for dataId in self.idList:
-            refList = dafPersist.searchDataRefs(butler, datasetType=self.datasetType,
-                                                level=self.level, dataId=dataId)
+            try:
+                cacheKey = frozenset(dataId.items())
+                refList = refListCache.get(cacheKey)
+            except TypeError:
+                # a data ID value is unhashable; search without caching
+                cacheKey = refList = None
+            if refList is None:
+                refList = searchDataRefs(butler, datasetType=datasetType, level=level, dataId=dataId)
+                if cacheKey is not None:
+                    refListCache[cacheKey] = refList
             if not refList:
                 namespace.log.warn("No data found for dataId=%s", dataId)
                 continue
@@ -267,6 +373,8 @@ class DynamicDatasetType(metaclass=abc.ABCMeta):
     command-line arguments.
     """
 
+    __slots__ = ()
+
     def addArgument(self, parser, idName):
         """Add a command-line argument to specify dataset type name,
         if wanted.
@@ -317,6 +425,8 @@ class DatasetArgument(DynamicDatasetType):
         not support default values.
     """
 
+    __slots__ = ("name", "help", "default")
+
     def __init__(self,
                  name=None,
                  help="dataset type to process from input data repository",
@@ -380,6 +490,8 @@ class ConfigDatasetType(DynamicDatasetType):
         Name of config option whose value is the dataset type.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         DynamicDatasetType.__init__(self)
         self.name = name
@@ -395,7 +507,7 @@ class ConfigDatasetType(DynamicDatasetType):
         """
         # getattr does not work reliably if the config field name is
         # dotted, so step through one level at a time
-        keyList = self.name.split(".")
+        keyList = _splitDottedName(self.name)
         value = namespace.config
         for key in keyList:
             try:
@@ -438,17 +550,7 @@ class ArgumentParser(argparse.ArgumentParser):
         argparse.ArgumentParser.__init__(self,
                                          usage=usage,
                                          fromfile_prefix_chars='@',
-                                         epilog=textwrap.dedent("""Notes:
-            * --config, --configfile, --id, --loglevel and @file may appear multiple times;
-                all values are used, in order left to right
-            * @file reads command-line options from the specified file:
-                * data may be distributed among multiple lines (e.g. one option per line)
-                * data after # is treated as a comment and ignored
-                * blank lines and lines starting with # are ignored
-            * To specify multiple values for an option, do not use = after the option name:
-                * right: --configfile foo bar
-                * wrong: --configfile=foo bar
-            """),
+                                         epilog=_EPILOG,
                                          formatter_class=argparse.RawDescriptionHelpFormatter,
                                          **kwargs)
         self.add_argument(metavar='input', dest="rawInput",
@@ -463,9 +565,11 @@ class ArgumentParser(argparse.ArgumentParser):
                                "optionally sets ROOT to ROOT/rerun/INPUT")
         self.add_argument("-c", "--config", nargs="*", action=ConfigValueAction,
                           help="config override(s), e.g. -c foo=newfoo bar.baz=3", metavar="NAME=VALUE")
+        # The actions for --configfile and --loglevel apply their values
+        # directly, so suppress the defaults to keep them off the namespace.
         self.add_argument("-C", "--configfile", dest="configfile", nargs="*", action=ConfigFileAction,
-                          help="config override file(s)")
-        self.add_argument("-L", "--loglevel", nargs="*", action=LogLevelAction,
+                          default=argparse.SUPPRESS, help="config override file(s)")
+        self.add_argument("-L", "--loglevel", nargs="*", action=LogLevelAction, default=argparse.SUPPRESS,
                           help="logging level; supported levels are [trace|debug|info|warn|error|fatal]",
                           metavar="LEVEL|COMPONENT=LEVEL")
         self.add_argument("--longlog", action="store_true", help="use a more verbose format for the logging")
@@ -495,18 +599,6 @@ class ArgumentParser(argparse.ArgumentParser):
                                 "them (safe with -j, but not all other forms of parallel execution)"))
         self.add_argument("--no-versions", action="store_true", dest="noVersions", default=False,
                           help="don't check package versions; useful for development")
-        lsstLog.configure_prop("""
-log4j.rootLogger=INFO, A1
-log4j.appender.A1=ConsoleAppender
-log4j.appender.A1.Target=System.out
-log4j.appender.A1.layout=PatternLayout
-log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
-""")
-
-        # Forward all Python logging to lsst.log
-        lgr = logging.getLogger()
-        lgr.setLevel(logging.INFO)  # same as in log4cxx config above
-        lgr.addHandler(lsstLog.LogHandler())
 
     def add_id_argument(self, name, datasetType, help, level=None, doMakeDataRefList=True,
                         ContainerClass=DataIdContainer):
@@ -622,6 +714,12 @@ log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
             else:
                 self.exit(f"{self.prog}: error: Must specify input as first argument")
 
+        self._configureLogging()
+
+        # Deferred so that constructing a parser or asking for --help does
+        # not pay for importing the butler.
+        import lsst.daf.persistence as dafPersist
+
         # Note that --rerun may change namespace.input, but if it does
         # we verify that the new input has the same mapper class.
         namespace = argparse.Namespace()
@@ -631,7 +729,7 @@ log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
 
         namespace.config = config
         namespace.log = log if log is not None else lsstLog.Log.getDefaultLogger()
-        mapperClass = dafPersist.Butler.getMapperClass(namespace.input)
+        mapperClass = _getMapperClass(namespace.input)
         if mapperClass is None:
             self.error(f"Error: no mapper specified for input repo {namespace.input!r}")
 
@@ -649,7 +747,6 @@ log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
             setattr(namespace, dataIdArgument.name, dataIdArgument.ContainerClass(level=dataIdArgument.level))
 
         namespace = argparse.ArgumentParser.parse_args(self, args=args, namespace=namespace)
-        del namespace.configfile
 
         self._parseDirectories(namespace)
 
@@ -694,7 +791,7 @@ log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
         # because it takes a long time to construct a butler
         self._processDataIds(namespace)
         if "data" in namespace.show:
-            for dataIdName in self._dataIdArgDict.keys():
+            for dataIdName in self._dataIdArgDict:
                 for dataRef in getattr(namespace, dataIdName).refList:
                     print(f"{dataIdName} dataRef.dataId = {dataRef.dataId}")
 
@@ -709,8 +806,6 @@ log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
                 print("Warning: no 'debug' module found", file=sys.stderr)
                 namespace.debug = False
 
-        del namespace.loglevel
-
         if namespace.longlog:
             lsstLog.configure_prop("""
 log4j.rootLogger=INFO, A1
@@ -726,6 +821,29 @@ log4j.appender.A1.layout.ConversionPattern=%-5p %d{yyyy-MM-ddTHH:mm:ss.SSSZ} %c
 
         return namespace
 
+    def _configureLogging(self):
+        """Configure lsst.log and forward Python logging to it.
+
+        Notes
+        -----
+        This is done when parsing rather than on construction, so that
+        building a parser (e.g. to print help) has no global side effects.
+        """
+        lsstLog.configure_prop("""
+log4j.rootLogger=INFO, A1
+log4j.appender.A1=ConsoleAppender
+log4j.appender.A1.Target=System.out
+log4j.appender.A1.layout=PatternLayout
+log4j.appender.A1.layout.ConversionPattern=%c %p: %m%n
+""")
+
+        # Forward all Python logging to lsst.log; only one handler is needed
+        # however many times the command line is parsed
+        lgr = logging.getLogger()
+        lgr.setLevel(logging.INFO)  # same as in log4cxx config above
+        if not any(isinstance(handler, lsstLog.LogHandler) for handler in lgr.handlers):
+            lgr.addHandler(lsstLog.LogHandler())
+
     def _parseDirectories(self, namespace):
         """Parse input, output and calib directories
 
@@ -733,7 +851,6 @@ log4j.appender.A1.layout.ConversionPattern=%-5p %d{yyyy-MM-ddTHH:mm:ss.SSSZ} %c
         "rerun".
         Modifications are made to the 'namespace' object in-place.
         """
-        mapperClass = dafPersist.Butler.getMapperClass(_fixPath(DEFAULT_INPUT_NAME, namespace.rawInput))
         namespace.calib = _fixPath(DEFAULT_CALIB_NAME, namespace.rawCalib)
 
         # If an output directory is specified, process it and assign it to the
@@ -753,20 +870,21 @@ log4j.appender.A1.layout.ConversionPattern=%-5p %d{yyyy-MM-ddTHH:mm:ss.SSSZ} %c
             if namespace.output:
                 self.error("Error: cannot specify both --output and --rerun")
             namespace.rerun = namespace.rawRerun.split(":")
-            rerunDir = [os.path.join(namespace.input, "rerun", dd) for dd in namespace.rerun]
-            modifiedInput = False
-            if len(rerunDir) == 2:
-                namespace.input, namespace.output = rerunDir
-                modifiedInput = True
-            elif len(rerunDir) == 1:
-                namespace.output = rerunDir[0]
-                if os.path.exists(os.path.join(namespace.output, "_parent")):
-                    namespace.input = os.path.realpath(os.path.join(namespace.output, "_parent"))
-                    modifiedInput = True
-            else:
+            if len(namespace.rerun) > 2:
                 self.error(f"Error: invalid argument for --rerun: {namespace.rerun}")
-            if modifiedInput and dafPersist.Butler.getMapperClass(namespace.input) != mapperClass:
-                self.error("Error: input directory specified by --rerun must have the same mapper as INPUT")
+            rerunRoot = os.path.join(namespace.input, "rerun")
+            namespace.output = os.path.join(rerunRoot, namespace.rerun[-1])
+            if len(namespace.rerun) == 2:
+                rerunInput = os.path.join(rerunRoot, namespace.rerun[0])
+            elif os.path.exists(os.path.join(namespace.output, "_parent")):
+                rerunInput = os.path.realpath(os.path.join(namespace.output, "_parent"))
+            else:
+                rerunInput = None
+            if rerunInput is not None:
+                if _getMapperClass(rerunInput) != _getMapperClass(namespace.input):
+                    self.error("Error: input directory specified by --rerun "
+                               "must have the same mapper as INPUT")
+                namespace.input = rerunInput
         else:
             namespace.rerun = None
         del namespace.rawInput
@@ -832,12 +950,17 @@ log4j.appender.A1.layout.ConversionPattern=%-5p %d{yyyy-MM-ddTHH:mm:ss.SSSZ} %c
             - ``config/<camera_name>/<task_name>.py`` and load if found.
         """
         obsPkgDir = lsst.utils.getPackageDir(namespace.obsPkg)
-        fileName = self._name + ".py"
-        for filePath in (
-            os.path.join(obsPkgDir, "config", fileName),
-            os.path.join(obsPkgDir, "config", namespace.camera, fileName),
-        ):
-            if os.path.exists(filePath):
+        cacheKey = (obsPkgDir, namespace.camera, self._name)
+        overrideFiles = _OVERRIDE_FILE_CACHE.get(cacheKey)
+        if overrideFiles is None:
+            fileName = self._name + ".py"
+            overrideFiles = tuple((filePath, os.path.exists(filePath)) for filePath in (
+                os.path.join(obsPkgDir, "config", fileName),
+                os.path.join(obsPkgDir, "config", namespace.camera, fileName),
+            ))
+            _OVERRIDE_FILE_CACHE[cacheKey] = overrideFiles
+        for filePath, exists in overrideFiles:
+            if exists:
                 namespace.log.info("Loading config overrride file %r", filePath)
                 namespace.config.load(filePath)
             else:
@@ -875,6 +998,15 @@ log4j.appender.A1.layout.ConversionPattern=%-5p %d{yyyy-MM-ddTHH:mm:ss.SSSZ} %c
         arg_line = arg_line.strip()
         if not arg_line or arg_line.startswith("#"):
             return
+        if ('"' not in arg_line and "'" not in arg_line and "\\" not in arg_line
+                and "\n" not in arg_line):
+            # Without quotes, escapes or embedded newlines (which end a
+            # comment) shlex just splits on whitespace and drops comments,
+            # and is much slower than doing that directly.
+            for arg in _ARG_TOKEN_RE.findall(arg_line.partition("#")[0]):
+                if arg.strip():
+                    yield arg
+            return
         for arg in shlex.split(arg_line, comments=True, posix=True):
             if not arg.strip():
                 continue
@@ -1097,9 +1229,7 @@ def showTaskHierarchy(config):
     print("Subtasks:")
     taskDict = getTaskDict(config=config)
 
-    fieldNameList = sorted(taskDict.keys())
-    for fieldName in fieldNameList:
-        taskName = taskDict[fieldName]
+    for fieldName, taskName in sorted(taskDict.items()):
         print(f"{fieldName}: {taskName}")
 
 
@@ -1125,9 +1255,10 @@ class ConfigValueAction(argparse.Action):
         if namespace.config is None:
             return
         for nameValue in values:
-            name, sep, valueStr = nameValue.partition("=")
-            if not valueStr:
+            mat = _NAME_VALUE_RE.match(nameValue)
+            if not mat:
                 parser.error(f"{option_string} value {nameValue} must be in form name=value")
+            name, valueStr = mat.groups()
 
             # see if setting the string value works; if not, try eval
             try:
@@ -1136,7 +1267,7 @@ class ConfigValueAction(argparse.Action):
                 parser.error(f"no config field: {name}")
             except Exception:
                 try:
-                    value = eval(valueStr, {})
+                    value = _parseConfigValue(valueStr)
                 except Exception:
                     parser.error(f"cannot parse {valueStr!r} as a value for {name}")
                 try:
@@ -1145,6 +1276,42 @@ class ConfigValueAction(argparse.Action):
                     parser.error(f"cannot set config.{name}={value!r}: {e}")
 
 
+def _parseConfigValue(valueStr):
+    """Convert the value of a ``-c name=value`` override to a Python object.
+
+    Parameters
+    ----------
+    valueStr : `str`
+        Value as given on the command line.
+
+    Returns
+    -------
+    value : `object`
+        The value of ``valueStr`` evaluated as a Python expression.
+
+    Raises
+    ------
+    Exception
+        Raised if ``valueStr`` cannot be evaluated.
+
+    Notes
+    -----
+    Constants and numbers are converted directly, and other literals
+    (strings, lists, dicts...) with `ast.literal_eval`. Only values that
+    are not literals, such as arithmetic expressions, are passed to `eval`.
+    """
+    if valueStr in _CONSTANT_VALUES:
+        return _CONSTANT_VALUES[valueStr]
+    if _INT_RE.match(valueStr):
+        return int(valueStr)
+    if _FLOAT_RE.match(valueStr):
+        return float(valueStr)
+    try:
+        return ast.literal_eval(valueStr)
+    except Exception:
+        return eval(valueStr, {})
+
+
 class ConfigFileAction(argparse.Action):
     """argparse action to load config overrides from one or more files.
     """
@@ -1227,28 +1394,39 @@ class IdValueAction(argparse.Action):
         idDict = collections.OrderedDict()
         for nameValue in values:
             name, sep, valueStr = nameValue.partition("=")
+            # every data ID dict shares these keys, and the butler looks
+            # them up repeatedly, so intern them for identity comparison
+            name = sys.intern(name)
             if name in idDict:
                 parser.error(f"{name} appears multiple times in one ID argument: {option_string}")
             idDict[name] = []
             for v in valueStr.split("^"):
-                mat = re.search(r"^(\d+)\.\.(\d+)(?::(\d+))?$", v)
+                mat = _RANGE_RE.match(v)
                 if mat:
                     v1 = int(mat.group(1))
                     v2 = int(mat.group(2))
                     v3 = mat.group(3)
                     v3 = int(v3) if v3 else 1
-                    for v in range(v1, v2 + 1, v3):
-                        idDict[name].append(str(v))
+                    idDict[name].extend(map(str, range(v1, v2 + 1, v3)))
                 else:
                     idDict[name].append(v)
 
-        iterList = [idDict[key] for key in idDict.keys()]
-        idDictList = [collections.OrderedDict(zip(idDict.keys(), valList))
-                      for valList in itertools.product(*iterList)]
-
         argName = option_string.lstrip("-")
         ident = getattr(namespace, argName)
-        ident.idList += idDictList
+        keyList = tuple(idDict)
+        if len(keyList) == 1:
+            # no cross product needed
+            key, = keyList
+            ident.idList.extend(collections.OrderedDict(((key, value),)) for value in idDict[key])
+        else:
+            # copying a keyed template is faster than building from zip()
+            template = collections.OrderedDict.fromkeys(keyList)
+            iterList = [idDict[key] for key in keyList]
+            for valList in itertools.product(*iterList):
+                dataId = template.copy()
+                for key, value in zip(keyList, valList):
+                    dataId[key] = value
+                ident.idList.append(dataId)
 
 
 class LogLevelAction(argparse.Action):
@@ -1271,17 +1449,13 @@ class LogLevelAction(argparse.Action):
         option_string : `str`
             Option value specified by the user.
         """
-        permittedLevelList = ('TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR', 'FATAL')
-        permittedLevelSet = set(permittedLevelList)
         for componentLevel in values:
             component, sep, levelStr = componentLevel.partition("=")
             if not levelStr:
                 levelStr, component = component, None
-            logLevelUpr = levelStr.upper()
-            if logLevelUpr in permittedLevelSet:
-                logLevel = getattr(lsstLog.Log, logLevelUpr)
-            else:
-                parser.error(f"loglevel={levelStr!r} not one of {permittedLevelList}")
+            logLevel = _LOG_LEVELS.get(levelStr.upper())
+            if logLevel is None:
+                parser.error(f"loglevel={levelStr!r} not one of {tuple(_LOG_LEVELS)}")
             if component is None:
                 namespace.log.setLevel(logLevel)
             else:
@@ -1319,11 +1493,9 @@ def setDottedAttr(item, name, value):
     For example if name is ``foo.bar.baz`` then ``item.foo.bar.baz``
     is set to the specified value.
     """
-    subitem = item
-    subnameList = name.split(".")
-    for subname in subnameList[:-1]:
-        subitem = getattr(subitem, subname)
-    setattr(subitem, subnameList[-1], value)
+    *parentNames, attrName = _splitDottedName(name)
+    subitem = functools.reduce(getattr, parentNames, item)
+    setattr(subitem, attrName, value)
 
 
 def getDottedAttr(item, name):
@@ -1343,7 +1515,21 @@ def getDottedAttr(item, name):
         If name is ``foo.bar.baz then the return value is
         ``item.foo.bar.baz``.
     """
-    subitem = item
-    for subname in name.split("."):
-        subitem = getattr(subitem, subname)
-    return subitem
+    return functools.reduce(getattr, _splitDottedName(name), item)
+
+
+@functools.lru_cache(maxsize=1024)
+def _splitDottedName(name):
+    """Split a hierarchical name such as ``foo.bar.baz`` into its parts.
+
+    Parameters
+    ----------
+    name : `str`
+        Dotted name.
+
+    Returns
+    -------
+    parts : `tuple` of `str`
+        The components of the name, e.g. ``("foo", "bar", "baz")``.
+    """
+    return tuple(name.split("."))
@@ -0,0 +1,200 @@
+# This file is part of pipe_base.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests of the parts of argumentParser that do not need a data repository.
+"""
+
+import argparse
+import unittest
+
+import lsst.utils.tests
+import lsst.log as lsstLog
+import lsst.pex.config as pexConfig
+import lsst.pipe.base as pipeBase
+from lsst.pipe.base.argumentParser import ConfigValueAction, IdValueAction, LogLevelAction, getDottedAttr, \
+    setDottedAttr
+
+
+class SubConfig(pexConfig.Config):
+    floatItem = pexConfig.Field(doc="a float", dtype=float, default=1.5)
+
+
+class SimpleConfig(pexConfig.Config):
+    intItem = pexConfig.Field(doc="an int", dtype=int, default=1)
+    boolItem = pexConfig.Field(doc="a bool", dtype=bool, default=False)
+    listItem = pexConfig.ListField(doc="a list of int", dtype=int, default=[])
+    sub = pexConfig.ConfigField(dtype=SubConfig, doc="a subconfig")
+
+
+class DottedAttrTestCase(lsst.utils.tests.TestCase):
+    """Test setDottedAttr and getDottedAttr."""
+
+    def testSetGet(self):
+        config = SimpleConfig()
+        setDottedAttr(config, "intItem", 3)
+        setDottedAttr(config, "sub.floatItem", 2.5)
+        self.assertEqual(config.intItem, 3)
+        self.assertEqual(config.sub.floatItem, 2.5)
+        self.assertEqual(getDottedAttr(config, "intItem"), 3)
+        self.assertEqual(getDottedAttr(config, "sub.floatItem"), 2.5)
+
+    def testMissing(self):
+        config = SimpleConfig()
+        with self.assertRaises(AttributeError):
+            getDottedAttr(config, "sub.missing")
+        with self.assertRaises(AttributeError):
+            setDottedAttr(config, "missing.floatItem", 2.5)
+
+
+class ConfigValueActionTestCase(lsst.utils.tests.TestCase):
+    """Test config overrides specified with ``-c name=value``."""
+
+    def setUp(self):
+        self.parser = argparse.ArgumentParser()
+        self.parser.add_argument("-c", "--config", nargs="*", action=ConfigValueAction)
+
+    def parseConfig(self, *args):
+        namespace = argparse.Namespace(config=SimpleConfig())
+        self.parser.parse_args(args=list(args), namespace=namespace)
+        return namespace.config
+
+    def testOverride(self):
+        config = self.parseConfig("-c", "intItem=3", "sub.floatItem=-2.5")
+        self.assertEqual(config.intItem, 3)
+        self.assertEqual(config.sub.floatItem, -2.5)
+
+    def testOverrideExpressions(self):
+        config = self.parseConfig("-c", "boolItem=True", "listItem=[1, 2]", "intItem=2*3",
+                                  "sub.floatItem=1e3")
+        self.assertIs(config.boolItem, True)
+        self.assertEqual(list(config.listItem), [1, 2])
+        self.assertEqual(config.intItem, 6)
+        self.assertEqual(config.sub.floatItem, 1000.0)
+
+    def testBadSyntax(self):
+        for nameValue in ("intItem", "intItem=", "=3"):
+            with self.subTest(nameValue=nameValue):
+                with self.assertRaises(SystemExit):
+                    self.parseConfig("-c", nameValue)
+
+    def testNonAsciiDigits(self):
+        """Non-ASCII digits are not numbers to eval, so must be rejected."""
+        for nameValue in ("intItem=\u0663", "sub.floatItem=\u0663.\u0665"):
+            with self.subTest(nameValue=nameValue):
+                with self.assertRaises(SystemExit):
+                    self.parseConfig("-c", nameValue)
+
+    def testBadName(self):
+        with self.assertRaises(SystemExit):
+            self.parseConfig("-c", "missing=3")
+
+
+class IdValueActionTestCase(lsst.utils.tests.TestCase):
+    """Test parsing of data ID arguments into ``idList``."""
+
+    def setUp(self):
+        self.parser = argparse.ArgumentParser()
+        self.parser.add_argument("--id", nargs="*", action=IdValueAction)
+
+    def parseIdList(self, *args):
+        namespace = argparse.Namespace(config=SimpleConfig(), id=pipeBase.DataIdContainer())
+        self.parser.parse_args(args=list(args), namespace=namespace)
+        return namespace.id.idList
+
+    def testRange(self):
+        idList = self.parseIdList("--id", "visit=0^2..4^7..9")
+        self.assertEqual([dataId["visit"] for dataId in idList], ["0", "2", "3", "4", "7", "8", "9"])
+
+    def testRangeStride(self):
+        idList = self.parseIdList("--id", "visit=1..6:2")
+        self.assertEqual([dataId["visit"] for dataId in idList], ["1", "3", "5"])
+
+    def testCrossProduct(self):
+        idList = self.parseIdList("--id", "visit=1^2", "ccd=1,1^2,2")
+        self.assertEqual(idList, [
+            dict(visit="1", ccd="1,1"),
+            dict(visit="1", ccd="2,2"),
+            dict(visit="2", ccd="1,1"),
+            dict(visit="2", ccd="2,2"),
+        ])
+
+    def testMultipleIdArguments(self):
+        idList = self.parseIdList("--id", "visit=1", "--id", "visit=3..4")
+        self.assertEqual([dataId["visit"] for dataId in idList], ["1", "3", "4"])
+
+
+class LogLevelActionTestCase(lsst.utils.tests.TestCase):
+    """Test log levels specified with ``--loglevel``."""
+
+    def setUp(self):
+        self.parser = argparse.ArgumentParser()
+        self.parser.add_argument("--loglevel", nargs="*", action=LogLevelAction)
+        self.log = lsstLog.Log.getLogger("test_argumentParser")
+
+    def parseLogLevel(self, *args):
+        namespace = argparse.Namespace(log=self.log)
+        self.parser.parse_args(args=list(args), namespace=namespace)
+
+    def testLevel(self):
+        self.parseLogLevel("--loglevel", "debug")
+        self.assertEqual(self.log.getLevel(), lsstLog.Log.DEBUG)
+        self.parseLogLevel("--loglevel", "Warn")
+        self.assertEqual(self.log.getLevel(), lsstLog.Log.WARN)
+
+    def testBadLevel(self):
+        for level in ("nonsense", "10"):
+            with self.subTest(level=level):
+                with self.assertRaises(SystemExit):
+                    self.parseLogLevel("--loglevel", level)
+
+
+class ArgFileTestCase(lsst.utils.tests.TestCase):
+    """Test splitting of lines read from ``@file`` argument files."""
+
+    def testConvertArgLine(self):
+        parser = pipeBase.ArgumentParser(name="test")
+        for argLine, expected in (
+            ("", []),
+            ("# a comment", []),
+            ("--id visit=1^2 ccd=3", ["--id", "visit=1^2", "ccd=3"]),
+            ("  -c foo=1  # trailing comment", ["-c", "foo=1"]),
+            ("-c foo=1#bar", ["-c", "foo=1"]),
+            ("-c foo='a b'", ["-c", "foo=a b"]),
+            ('-c foo="a#b"', ["-c", "foo=a#b"]),
+            ("-c foo=a\\ b", ["-c", "foo=a b"]),
+            ("-c foo=a\xa0b", ["-c", "foo=a\xa0b"]),
+            ("-c foo=a\x0cb", ["-c", "foo=a\x0cb"]),
+        ):
+            with self.subTest(argLine=argLine):
+                self.assertEqual(list(parser.convert_arg_line_to_args(argLine)), expected)
+
+
+class MyMemoryTestCase(lsst.utils.tests.MemoryTestCase):
+    pass
+
+
+def setup_module(module):
+    lsst.utils.tests.init()
+
+
+if __name__ == "__main__":
+    lsst.utils.tests.init()
+    unittest.main()
@@ -52,6 +52,50 @@ class DataIdContainerTestCase(lsst.utils.tests.TestCase):
             self.container.castDataIds(self.butler)
         self.assertIsInstance(cm.exception.__cause__, KeyError)
 
+    def test_castDataIds(self):
+        """Test that castDataIds casts values to the butler's key types."""
+        self.container.setDatasetType("calexp")
+        self.container.idList = [dict(visit="1", filter="r"), dict(visit="2", filter="r"),
+                                 dict(visit="1", filter="i")]
+        self.butler.getKeys.return_value = dict(visit=int, filter=str)
+        self.container.castDataIds(self.butler)
+        self.assertEqual(self.container.idList, [dict(visit=1, filter="r"), dict(visit=2, filter="r"),
+                                                 dict(visit=1, filter="i")])
+
+    def test_castDataIdsBadValue(self):
+        """Test that castDataIds raises TypeError for an uncastable value."""
+        self.container.setDatasetType("calexp")
+        self.container.idList = [dict(visit="one")]
+        self.butler.getKeys.return_value = dict(visit=int)
+        with self.assertRaises(TypeError):
+            self.container.castDataIds(self.butler)
+
+    def test_castDataIdsReportsAllBadValues(self):
+        """Test that castDataIds reports every uncastable value once."""
+        self.container.setDatasetType("calexp")
+        self.container.idList = [dict(visit="one", ccd="1"), dict(visit="one", ccd="two")]
+        self.butler.getKeys.return_value = dict(visit=int, ccd=int)
+        with self.assertRaises(TypeError) as cm:
+            self.container.castDataIds(self.butler)
+        message = str(cm.exception)
+        self.assertEqual(message.count("'one'"), 1)
+        self.assertIn("'two'", message)
+
+    def test_makeDataRefListDuplicateIds(self):
+        """Test that a repeated data ID only searches the butler once."""
+        self.container.setDatasetType("calexp")
+        self.container.idList = [dict(visit=1), dict(visit=2), dict(visit=1)]
+        namespace = unittest.mock.MagicMock(butler=self.butler)
+
+        def mockSearch(butler, datasetType, level, dataId):
+            return [dataId["visit"]]
+
+        with unittest.mock.patch("lsst.daf.persistence.searchDataRefs",
+                                 side_effect=mockSearch) as searchDataRefs:
+            self.container.makeDataRefList(namespace)
+        self.assertEqual(searchDataRefs.call_count, 2)
+        self.assertEqual(self.container.refList, [1, 2, 1])
+
 
 class MyMemoryTestCase(lsst.utils.tests.MemoryTestCase):
     pass